@@ -2,37 +2,136 @@ import json
 import sys
 import re
 import html
+import threading
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
+from urllib.parse import urlparse, parse_qs
 from typing import Optional, Any
 from difflib import SequenceMatcher
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 from py_common import log
 from py_common.cache import cache_to_disk
 
 
 # Constants
 BASE_URL = "https://megasite.meanworld.com"
+BASE_HOST = urlparse(BASE_URL).hostname
 DEFAULT_DIRECTOR = "Glenn King"
 MAX_SEARCH_PAGES = 5
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:128.0) Gecko/20100101 Firefox/128.0"
+MISSING_URLS_FILE = Path(__file__).resolve().parent / "missing_urls.json"
+MISSING_URL_TTL = 86400  # Dead links rarely come back, so remember 404s for a day
 
+# Patterns used on every scrape, compiled once
+_RE_IMG_UPGRADE = re.compile(r'/meanbitches/content/contentthumbs/(.*)-[1234]x\.jpg$')
+_RE_THUMB_JS = re.compile(rb'thumbnail:\s*"([^"]*\.jpg)"')
+_RE_DATE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})')
+_RE_UPLOAD = re.compile(rb'/content//upload/([^/]+)/')
+_RE_SCENE_LINK = re.compile(r'https://megasite\.meanworld\.com/scenes/.*_vids\.html')
+_RE_STUDIO_HREF = re.compile(r'^/[^/]+/$')
 
-def fetch_html(url: str, timeout: int = 10, params: Optional[dict] = None) -> str:
-    """Fetch HTML content from URL."""
-    if not url or not isinstance(url, str):
-        raise ValueError(f"Invalid URL: {url}")
+# Element types that carry scene page fields, visited by _extract_all
+_SCENE_FIELD_TAGS = ('div', 'a', 'li', 'meta', 'img')
+
+# Search result queries, compiled once instead of per container
+_XP_CONTAINERS = etree.XPath(
+    '//div[contains(@class, "latestUpdateB")'
+    ' and not(contains(concat(" ", normalize-space(@class), " "), " latestUpdateBinfo "))]'
+)
+_XP_SCENE_LINKS = etree.XPath('.//a[contains(@href, "_vids.html")]')
+_XP_MODEL_LINK = etree.XPath('(.//a[starts-with(@href, "https://megasite.meanworld.com/models/")])[1]')
+_XP_RELATIVE_LINKS = etree.XPath('.//a[starts-with(@href, "/")]')
+_XP_PAGE_HREFS = etree.XPath('//a[contains(@href, "page=")]/@href')
+
+
+def _build_session() -> requests.Session:
+    """Build a shared session so search, scene and image requests reuse pooled connections."""
+    session = requests.Session()
+    retries = Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries))
+    # Advertise every encoding urllib3 can decode here (br/zstd only when their packages are installed)
+    session.headers.update(make_headers(keep_alive=True, accept_encoding=True, user_agent=USER_AGENT))
+    return session
+
+
+_SESSION = _build_session()
+# Guards MISSING_URLS_FILE, which fragment resolving may touch from several threads
+_missing_urls_lock = threading.Lock()
 
+
+class PageNotFoundError(Exception):
+    """Raised when a page returns HTTP 404."""
+
+
+def _request_html(url: str, timeout: int, params: Optional[dict] = None) -> bytes:
+    """Request a page over the shared session and return its raw bytes."""
     try:
-        response = requests.get(url, params=params, timeout=timeout)
+        response = _SESSION.get(url, params=params, timeout=timeout)
         response.raise_for_status()
-        return response.text
+        return response.content
     except requests.exceptions.HTTPError as e:
+        if e.response.status_code == 404:
+            raise PageNotFoundError(f"HTTP Error 404: {str(e)}")
         raise Exception(f"HTTP Error {e.response.status_code}: {str(e)}")
     except requests.exceptions.RequestException as e:
         raise Exception(f"Network error: {str(e)}")
 
 
+def _load_missing_urls() -> dict:
+    """Read the URL -> timestamp map of pages that returned 404."""
+    try:
+        return json.loads(MISSING_URLS_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _is_known_missing(url: str) -> bool:
+    """Check whether url returned 404 within the last MISSING_URL_TTL seconds."""
+    with _missing_urls_lock:
+        seen = _load_missing_urls().get(url)
+    return seen is not None and time.time() - seen < MISSING_URL_TTL
+
+
+def _remember_missing(url: str) -> None:
+    """Record that url returned 404, dropping expired entries."""
+    now = time.time()
+    with _missing_urls_lock:
+        missing = {u: seen for u, seen in _load_missing_urls().items() if now - seen < MISSING_URL_TTL}
+        missing[url] = now
+        try:
+            MISSING_URLS_FILE.write_text(json.dumps(missing))
+        except OSError as e:
+            log.debug(f"Error saving missing URLs: {str(e)}")
+
+
+def fetch_html(url: str, timeout: int = 10, params: Optional[dict] = None) -> bytes:
+    """Fetch raw HTML content from URL, leaving decoding to the parser.
+
+    Raises PageNotFoundError on 404. For plain URLs (no params) the 404 is
+    remembered, so known dead links are not requested again.
+    """
+    if not url or not isinstance(url, str):
+        raise ValueError(f"Invalid URL: {url}")
+
+    if not params and _is_known_missing(url):
+        raise PageNotFoundError(f"HTTP Error 404: {url} (cached)")
+
+    try:
+        return _request_html(url, timeout, params)
+    except PageNotFoundError:
+        if not params:
+            _remember_missing(url)
+        raise
+
+
 def normalize_url(url: str) -> Optional[str]:
     """Convert relative URL to absolute URL."""
     if not url or not isinstance(url, str):
@@ -42,6 +141,15 @@ def normalize_url(url: str) -> Optional[str]:
     return f"{BASE_URL}{url}" if url.startswith('/') else url or None
 
 
+@lru_cache(maxsize=512)
+def _parse_us_date(date_str: str) -> Optional[str]:
+    """Convert an MM/DD/YYYY date to YYYY-MM-DD, or None if it is not a valid date."""
+    try:
+        return datetime.strptime(date_str, "%m/%d/%Y").strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+
 def extract_title_from_filename(filename: str) -> Optional[str]:
     """Extract title from video filename by removing path and extension."""
     if not filename or not isinstance(filename, str):
@@ -64,7 +172,8 @@ def readJSONInput() -> dict:
             log.error("No input data received")
             sys.exit(69)
         parsed = json.loads(input_data)
-        log.debug(f"Input received: {json.dumps(parsed)}")
+        # Log the raw text rather than re-serialising the parsed payload
+        log.debug(f"Input received: {input_data.strip()}")
         return parsed
     except json.JSONDecodeError as e:
         log.error(f"Invalid JSON input: {str(e)}")
@@ -74,150 +183,151 @@ def readJSONInput() -> dict:
         sys.exit(69)
 
 
-def extract_title(html_content: str) -> Optional[str]:
-    """Extract title from data-title attribute of packageinfo div."""
+def _parse_html(content: bytes) -> Optional[lxml.html.HtmlElement]:
+    """Parse raw UTF-8 page bytes, letting libxml2 do the decoding.
+
+    Returns None for a page with no elements (blank, whitespace, BOM or
+    comments only), which lxml refuses to parse.
+    """
+    # Parsers must not be shared between threads, so build one per page
     try:
-        soup = BeautifulSoup(html_content, 'lxml')
-        packageinfo = soup.find('div', id=re.compile(r'packageinfo_\d+'))
-        if packageinfo and packageinfo.get('data-title'):
-            return html.unescape(str(packageinfo['data-title']))
-    except Exception as e:
-        log.debug(f"Error extracting title: {str(e)}")
-    return None
+        return lxml.html.fromstring(content, parser=lxml.html.HTMLParser(encoding="utf-8"))
+    except etree.ParserError:
+        return None
 
 
-def extract_details(html_content: str) -> Optional[str]:
-    """Extract details from vidImgContent paragraph."""
-    try:
-        soup = BeautifulSoup(html_content, 'lxml')
-        vid_content = soup.find('div', class_=re.compile(r'vidImgContent'))
-        if vid_content:
-            p_tag = vid_content.find('p')
-            if p_tag:
-                return html.unescape(p_tag.get_text(strip=True))
-    except Exception as e:
-        log.debug(f"Error extracting details: {str(e)}")
-    return None
+def _text(element) -> str:
+    """Return the stripped text of an element and its descendants."""
+    return "".join(part.strip() for part in element.itertext())
 
 
-def extract_studio_name(html_content: str) -> Optional[str]:
-    """Extract studio name from breadcrumb link."""
-    try:
-        soup = BeautifulSoup(html_content, 'lxml')
-        for link in soup.find_all('a', class_='link_bright'):
-            href = str(link.get('href', ''))
-            # Studio links have relative hrefs
-            if href.startswith('/'):
-                return html.unescape(link.get_text(strip=True))
-    except Exception as e:
-        log.debug(f"Error extracting studio name: {str(e)}")
+def _scene_image(og_image: Optional[str], preview_image: Optional[str]) -> Optional[str]:
+    """Pick the scene image from og:image, falling back to the dvd_preview_thumb source."""
+    # 1: try og:image meta tag
+    if og_image:
+        url = og_image.strip()
+        # Skip empty URLs or URLs that are just the base path
+        if url and not url.endswith('contentthumbs/'):
+            # Upgrade to 4x quality: convert any version (1x, 2x, 3x) to 4x
+            url = _RE_IMG_UPGRADE.sub(r'/content//contentthumbs/\1-4x.jpg', url)
+            if url:
+                return url
+
+    # 2: Extract preview image from dvd_preview_thumb class
+    if preview_image:
+        thumb_url = preview_image.strip()
+        if thumb_url:
+            return normalize_url(thumb_url) or thumb_url
+
     return None
 
 
-def extract_performers(html_content: str) -> list:
-    """Extract all performer names from infolink class."""
+def _extract_all(root: lxml.html.HtmlElement) -> dict:
+    """Extract scene fields from a page in a single pass over its elements.
+
+    Returns any of: title, details, studio_name, performers, image, date, tags.
+    Each single-valued field comes from the first matching element, as the
+    individual extractors did.
+    """
+    fields: dict[str, Any] = {}
     performers = []
-    try:
-        soup = BeautifulSoup(html_content, 'lxml')
-        for link in soup.find_all('a', class_=re.compile(r'link_bright.*infolink')):
-            name = link.get_text(strip=True)
-            if name:
-                performers.append({"name": html.unescape(name)})
-    except Exception as e:
-        log.debug(f"Error extracting performers: {str(e)}")
-    return performers
+    tags = []
+    og_image = preview_image = None
+    # Containers that only count the first time they appear, even if they turn out empty
+    seen_details = seen_tags = seen_preview = False
+
+    # Only visit the element types that carry scene fields
+    for el in root.iter(*_SCENE_FIELD_TAGS):
+        tag = el.tag
+        # Guard each element so one bad node doesn't drop the fields after it
+        try:
+            classes = el.get('class', '')
+
+            if tag == 'div':
+                if 'title' not in fields and el.get('id', '').startswith('packageinfo_'):
+                    if data_title := el.get('data-title'):
+                        fields['title'] = html.unescape(data_title)
+                if not seen_details and 'vidImgContent' in classes:
+                    seen_details = True
+                    p_tag = el.find('.//p')
+                    if p_tag is not None:
+                        fields['details'] = html.unescape(_text(p_tag))
+                if not seen_tags and 'blogTags' in classes:
+                    seen_tags = True
+                    for link in el.iter('a'):
+                        if 'border_btn' in link.get('class', '') and (tag_name := _text(link)):
+                            tags.append({"name": html.unescape(tag_name)})
+
+            elif tag == 'a' and 'link_bright' in classes:
+                # Studio links have relative hrefs
+                if 'studio_name' not in fields and el.get('href', '').startswith('/'):
+                    fields['studio_name'] = html.unescape(_text(el))
+                if 'infolink' in classes and (name := _text(el)):
+                    performers.append({"name": html.unescape(name)})
+
+            elif tag == 'li' and 'date' not in fields and 'text_med' in classes:
+                if date_match := _RE_DATE.search(_text(el)):
+                    date_str = date_match.group(1).strip()
+                    fields['date'] = _parse_us_date(date_str) or date_str
+
+            elif tag == 'meta' and og_image is None and el.get('property') == 'og:image':
+                og_image = el.get('content', '')
+
+            elif tag == 'img' and not seen_preview and 'dvd_preview_thumb' in classes:
+                seen_preview = True
+                preview_image = el.get('src', '')
 
+        except Exception as e:
+            log.debug(f"Error extracting scene fields from <{tag}>: {str(e)}")
+
+    if performers:
+        fields['performers'] = performers
+    if tags:
+        fields['tags'] = tags
+    if image := _scene_image(og_image, preview_image):
+        fields['image'] = image
+
+    return fields
 
-def extract_image(html_content: str) -> Optional[str]:
-    """Extract image URL from og:image meta tag, preview thumb, scene search results, or JavaScript."""
+
+def extract_image(html_content: bytes, title: Optional[str] = None) -> Optional[str]:
+    """Extract image URL from JavaScript or scene search results.
+
+    Used when the page has no usable og:image or preview thumb. The search
+    fallback needs the scene title, which the caller already has.
+    """
     try:
-        soup = BeautifulSoup(html_content, 'lxml')
-
-        # 1: try og:image meta tag
-        og_image = soup.find('meta', property='og:image')
-        if og_image:
-            url = str(og_image.get('content', '')).strip()
-            # Skip empty URLs or URLs that are just the base path
-            if url and not url.endswith('contentthumbs/'):
-                # Upgrade to 4x quality: convert any version (1x, 2x, 3x) to 4x
-                url = re.sub(r'/meanbitches/content/contentthumbs/(.*)-[1234]x\.jpg$', r'/content//contentthumbs/\1-4x.jpg', url)
-                if url:
-                    return url
-
-        # 2: Extract preview image from dvd_preview_thumb class
-        preview_img = soup.find('img', class_=re.compile(r'dvd_preview_thumb'))
-        if preview_img:
-            thumb_url = str(preview_img.get('src', '')).strip()
+        # 3: try to extract movie thumbnail from JavaScript
+        thumb_match = _RE_THUMB_JS.search(html_content)
+        if thumb_match:
+            thumb_url = thumb_match.group(1).decode("utf-8", errors="replace").strip()
             if thumb_url:
                 return normalize_url(thumb_url) or thumb_url
 
-        # 3: search for scene by title to get image from search results
-        title = extract_title(html_content)
+        # 4: search for scene by title to get image from search results
         if title:
             search_results = search_scenes_by_name(title)
             if search_results and search_results[0].get("image"):
                 return search_results[0]["image"]
 
-        # 4: try to extract movie thumbnail from JavaScript
-        thumb_match = re.search(r'thumbnail:\s*"([^"]*\.jpg)"', html_content)
-        if thumb_match:
-            thumb_url = thumb_match.group(1).strip()
-            if thumb_url:
-                return normalize_url(thumb_url) or thumb_url
-
     except Exception as e:
         log.debug(f"Error extracting image: {str(e)}")
 
     return None
 
 
-def extract_date(html_content: str) -> Optional[str]:
-    """Extract date from page"""
-    try:
-        soup = BeautifulSoup(html_content, 'lxml')
-        for li in soup.find_all('li', class_=re.compile(r'text_med')):
-            text = li.get_text(strip=True)
-            date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', text)
-            if date_match:
-                date_str = date_match.group(1).strip()
-                try:
-                    parsed_date = datetime.strptime(date_str, "%m/%d/%Y")
-                    return parsed_date.strftime("%Y-%m-%d")
-                except ValueError:
-                    return date_str
-    except Exception as e:
-        log.debug(f"Error extracting date: {str(e)}")
-    return None
-
-
-def extract_tags(html_content: str) -> list:
-    """Extract all tag names from blogTags."""
-    tags = []
-    try:
-        soup = BeautifulSoup(html_content, 'lxml')
-        blogtags_div = soup.find('div', class_=re.compile(r'blogTags'))
-        if blogtags_div:
-            for link in blogtags_div.find_all('a', class_=re.compile(r'border_btn')):
-                tag_name = link.get_text(strip=True)
-                if tag_name:
-                    tags.append({"name": html.unescape(tag_name)})
-    except Exception as e:
-        log.debug(f"Error extracting tags: {str(e)}")
-    return tags
-
-
-def extract_studio_code(html_content: str) -> Optional[str]:
+def extract_studio_code(html_content: bytes) -> Optional[str]:
     """Extract studio code from upload path in HTML."""
     try:
-        match = re.search(r'/content//upload/([^/]+)/', html_content)
+        match = _RE_UPLOAD.search(html_content)
         if match:
-            return match.group(1)
+            return match.group(1).decode("utf-8", errors="replace")
     except Exception as e:
         log.debug(f"Error extracting studio code: {str(e)}")
     return None
 
 
-def extract_search_result_data(container, scene_url: str, title: str) -> dict:
+def extract_search_result_data(container: lxml.html.HtmlElement, scene_url: str, title: str) -> dict:
     """Extract scene data from search results HTML without scraping individual pages.
 
     Extracts: title, url, image, performer, studio, date
@@ -229,49 +339,44 @@ def extract_search_result_data(container, scene_url: str, title: str) -> dict:
     }
 
     try:
-        soup = container
+        # Thumbnail is an update_thumb IMG or VIDEO; a single walk finds whichever is present
+        thumb = next((el for el in container.iter('img', 'video') if 'update_thumb' in el.get('class', '')), None)
 
-        img_tag = soup.find('img', class_='update_thumb')
-        video_tag = soup.find('video', class_='update_thumb')
-
-        if img_tag:
-            # IMG tag: try src0_2x, src0_1x, then src
-            img_url = img_tag.get('src0_2x') or img_tag.get('src0_1x') or img_tag.get('src')
-            if img_url:
-                img_url = img_url.strip()
-                img_url = normalize_url(img_url) or img_url
-                result["image"] = img_url
-        elif video_tag:
-            # VIDEO tag: try poster_2x, poster_1x, then poster (poster attribute uses poster_Nx naming)
-            img_url = video_tag.get('poster_2x') or video_tag.get('poster_1x') or video_tag.get('poster')
+        if thumb is not None:
+            if thumb.tag == 'img':
+                # IMG tag: try src0_2x, src0_1x, then src
+                img_url = thumb.get('src0_2x') or thumb.get('src0_1x') or thumb.get('src')
+            else:
+                # VIDEO tag: try poster_2x, poster_1x, then poster (poster attribute uses poster_Nx naming)
+                img_url = thumb.get('poster_2x') or thumb.get('poster_1x') or thumb.get('poster')
             if img_url:
                 img_url = img_url.strip()
                 img_url = normalize_url(img_url) or img_url
                 result["image"] = img_url
 
         # Extract performer
-        perf_link = soup.find('a', href=re.compile(r'https://megasite\.meanworld\.com/models/'))
-        if perf_link:
-            perf_name = perf_link.get_text(strip=True)
+        perf_links = _XP_MODEL_LINK(container)
+        if perf_links:
+            perf_name = _text(perf_links[0])
             result["performers"] = [{"name": perf_name}]
 
         # Extract studio
-        studio_link = soup.find('a', href=re.compile(r'^/[^/]+/$'))
-        if studio_link:
-            studio_name = studio_link.get_text(strip=True)
-            result["studio"] = {"name": studio_name}
+        for link in _XP_RELATIVE_LINKS(container):
+            if _RE_STUDIO_HREF.match(link.get('href', '')):
+                studio_name = _text(link)
+                result["studio"] = {"name": studio_name}
+                break
 
         # Extract date
-        for li in soup.find_all('li', class_='text_med'):
-            date_text = li.get_text(strip=True)
-            if re.match(r'\d{1,2}/\d{1,2}/\d{4}', date_text):
-                try:
-                    parsed_date = datetime.strptime(date_text, "%m/%d/%Y")
-                    result["date"] = parsed_date.strftime("%Y-%m-%d")
+        for li in container.iter('li'):
+            if 'text_med' not in li.get('class', ''):
+                continue
+            date_text = _text(li)
+            if _RE_DATE.match(date_text):
+                # Invalid dates return None, so continue to next date candidate
+                if parsed_date := _parse_us_date(date_text):
+                    result["date"] = parsed_date
                     break
-                except (ValueError, AttributeError):
-                    # Invalid date format, continue to next date candidate
-                    pass
 
     except Exception as e:
         log.debug(f"Error parsing search result: {str(e)}")
@@ -280,52 +385,64 @@ def extract_search_result_data(container, scene_url: str, title: str) -> dict:
 
 
 def _fetch_and_parse_search_page(query: str, page: int, search_name: str) -> tuple:
-    """Fetch and parse a single search results page. Returns (results_list, has_exact_match)."""
+    """Fetch and parse a single search results page.
+
+    Returns (results_list, has_exact_match, has_next_page). Fetch errors
+    are raised so a failed search is never cached.
+    """
     page_results = []
     has_exact_match = False
+    has_next_page = False
 
-    try:
-        # Build search URL with params
-        search_url = "https://megasite.meanworld.com/search.php"
-        params: dict[str, Any] = {"query": query}
-        if page > 1:
-            params["page"] = page
+    # Build search URL with params
+    search_url = "https://megasite.meanworld.com/search.php"
+    params: dict[str, Any] = {"query": query}
+    if page > 1:
+        params["page"] = page
 
-        # Fetch page
-        try:
-            html_content = fetch_html(search_url, params=params)
-        except Exception as e:
-            log.error(f"Error fetching search page {page}: {str(e)}")
-            return page_results, has_exact_match
+    try:
+        html_content = fetch_html(search_url, params=params)
+    except Exception as e:
+        raise Exception(f"Error fetching search page {page}: {str(e)}")
 
+    try:
         # Parse results
         try:
-            soup = BeautifulSoup(html_content, 'lxml')
-            all_containers = soup.find_all('div', class_=re.compile(r'latestUpdateB'))
+            root = _parse_html(html_content)
+            if root is None:
+                # Blank page, so no results
+                return page_results, has_exact_match, has_next_page
+
+            # The pagination links point at the next page unless this is the last one
+            next_page = str(page + 1)
+            has_next_page = any(
+                next_page in parse_qs(urlparse(href).query).get("page", ())
+                for href in _XP_PAGE_HREFS(root)
+            )
+
+            # latestUpdateBinfo containers are excluded by the query itself
+            all_containers = _XP_CONTAINERS(root)
 
             if not all_containers:
-                return page_results, has_exact_match
+                return page_results, has_exact_match, has_next_page
 
             for container in all_containers:
                 try:
-                    # Skip latestUpdateBinfo containers
-                    classes = container.get('class') or []
-                    if isinstance(classes, list) and 'latestUpdateBinfo' in classes:
-                        continue
-
                     # Find the scene link
                     scene_link = None
-                    for link in container.find_all('a', href=re.compile(r'https://megasite\.meanworld\.com/scenes/.*_vids\.html')):
-                        title = link.get_text(strip=True)
+                    for link in _XP_SCENE_LINKS(container):
+                        if not _RE_SCENE_LINK.search(link.get('href')):
+                            continue
+                        title = _text(link)
                         if title:
                             scene_link = link
                             break
 
-                    if not scene_link:
+                    if scene_link is None:
                         continue
 
                     scene_url = str(scene_link.get('href', ''))
-                    title = scene_link.get_text(strip=True)
+                    title = _text(scene_link)
 
                     if not scene_url or not title:
                         continue
@@ -348,31 +465,52 @@ def _fetch_and_parse_search_page(query: str, page: int, search_name: str) -> tup
     except Exception as e:
         log.error(f"Error in _fetch_and_parse_search_page: {str(e)}")
 
-    return page_results, has_exact_match
+    return page_results, has_exact_match, has_next_page
 
 
+@cache_to_disk(ttl=3600)  # Cache for 1 hour
 def _search(query: str, name: str, max_pages: int) -> list:
-    """Fetch search results."""
-    results = []
-    exact_match_found = False
+    """Fetch search results, following the site's pagination.
 
-    for page in range(1, max_pages + 1):
-        if exact_match_found:
-            break
+    Page 1 is fetched on its own; only if it links to a next page are the
+    remaining pages requested, concurrently. Only the parsed results are
+    cached, and only from the calling thread; the page workers never touch
+    the disk cache.
+    """
+    results, has_exact_match, has_next_page = _fetch_and_parse_search_page(query, 1, name)
+    if has_exact_match:
+        log.debug("Exact match found on page 1, stopping search")
+        return results
+    if not has_next_page or max_pages < 2:
+        return results
 
-        page_results, has_exact_match = _fetch_and_parse_search_page(query, page, name)
-        results.extend(page_results)
+    with ThreadPoolExecutor(max_workers=min(max_pages - 1, 4)) as executor:
+        futures = [
+            executor.submit(_fetch_and_parse_search_page, query, page, name)
+            for page in range(2, max_pages + 1)
+        ]
+        try:
+            # Read in page order to preserve the site's relevance ordering
+            for page, future in enumerate(futures, start=2):
+                page_results, has_exact_match, has_next_page = future.result()
+                results.extend(page_results)
+                if has_exact_match:
+                    log.debug(f"Exact match found on page {page}, stopping search")
+                    break
+                if not page_results or not has_next_page:
+                    break
+        finally:
+            # Drop pages past the last one that haven't started; a failed page fails the whole search
+            for pending in futures:
+                pending.cancel()
 
-        if has_exact_match:
-            exact_match_found = True
-            log.debug(f"Exact match found on page {page}, stopping search")
-            break
+    return results
 
-        # Stop if no results on this page
-        if not page_results:
-            break
 
-    return results
+def _relevance_score(scene: dict, query_lower: str) -> float:
+    """Score how closely a scene's title matches the lowercased query (higher is better)."""
+    title = scene.get("title", "").lower()
+    return SequenceMatcher(None, query_lower, title).ratio()
 
 
 def search_scenes_by_name(name: str) -> list:
@@ -389,13 +527,8 @@ def search_scenes_by_name(name: str) -> list:
             return results
 
         max_pages = 5
-        results = _search(name, name, max_pages)
-
-        def relevance_score(scene):
-            title = scene.get("title", "").lower()
-            return SequenceMatcher(None, name.lower(), title).ratio() * 1000
-
-        results.sort(key=relevance_score, reverse=True)
+        # Sort a copy; the list may be the disk cache's own value
+        results = sorted(_search(name, name, max_pages), key=partial(_relevance_score, query_lower=name.lower()), reverse=True)
 
         # Log sample of first result
         if results:
@@ -426,49 +559,65 @@ def _resolve_scene_fragment(scene_fragment: dict, prefer_exact_match: bool = Fal
         if main_url and main_url not in urls_to_try:
             urls_to_try.append(main_url)
 
-    # Try each URL in order
+    # Only megasite URLs can be scraped
+    scrape_urls = []
     for url in urls_to_try:
         if url and isinstance(url, str) and url.startswith("http"):
-            # Check domain requirement if specified
-            if "megasite.meanworld.com" not in url:
+            # Only megasite hosts the scenes; meanbitches.com URLs return 404
+            if urlparse(url).hostname != BASE_HOST:
                 # Skip non-megasite URLs and continue to next URL
                 continue
-
-            try:
-                result = scrapeSceneURL(url)
-                # Only return result if it has meaningful data (at least a title)
-                # Gallery pages might scrape "successfully" but only get studio/director
-                if result.get("title"):
-                    return result
-                else:
-                    log.debug(f"URL {url} returned incomplete data (no title), trying next URL")
-            except Exception as e:
-                # If URL fails, try next URL or fall through to search by title
-                log.debug(f"Failed to scrape URL {url}, trying next URL: {str(e)}")
+            if url not in scrape_urls:
+                scrape_urls.append(url)
 
     # Extract title from fragment or filename
     title = scene_fragment.get("title")
     if not title and "file_name" in scene_fragment:
         title = extract_title_from_filename(scene_fragment.get("file_name", ""))
 
+    # Result of each URL already attempted (None if it failed), so search matches aren't scraped twice
+    tried: dict[str, Optional[dict]] = {}
+
+    # Try each URL in order; the next one is only fetched once the previous one has failed
+    for url in scrape_urls:
+        try:
+            result = scrapeSceneURL(url)
+            tried[url] = result
+            # Only return result if it has meaningful data (at least a title)
+            # Gallery pages might scrape "successfully" but only get studio/director
+            if result.get("title"):
+                return result
+            else:
+                log.debug(f"URL {url} returned incomplete data (no title), trying next URL")
+        except Exception as e:
+            tried[url] = None
+            # If URL fails, try next URL or fall through to search by title
+            log.debug(f"Failed to scrape URL {url}, trying next URL: {str(e)}")
+
     # Search by title if available
     if title:
         log.debug(f"All URLs failed, falling back to search by title: '{title}'")
         search_results = search_scenes_by_name(title)
         if search_results:
+            best_match = search_results[0]
             if prefer_exact_match:
                 # Find the best match: prefer exact title match, otherwise use first result
-                best_match = search_results[0]
                 for result in search_results:
                     if result["title"].lower() == title.lower():
                         best_match = result
                         break
                 log.debug(f"Found {len(search_results)} search results, using best match: {best_match.get('url')}")
-                return scrapeSceneURL(best_match["url"])
             else:
-                # Return the first (best) match
-                log.debug(f"Found {len(search_results)} search results, using first: {search_results[0].get('url')}")
-                return scrapeSceneURL(search_results[0]["url"])
+                # Use the first (best) match
+                log.debug(f"Found {len(search_results)} search results, using first: {best_match.get('url')}")
+
+            best_url = best_match["url"]
+            if best_url not in tried:
+                return scrapeSceneURL(best_url)
+            if tried[best_url] is not None:
+                # Same URL the fragment already had; reuse that scrape
+                return tried[best_url]
+            log.debug(f"Search match {best_url} already failed to scrape")
         else:
             log.debug(f"No search results found for title: '{title}'")
     else:
@@ -507,30 +656,34 @@ def scrapeSceneURL(url: str) -> dict:
     ret: dict[str, Any] = {'url': url}
 
     html_content = fetch_html(url)
+    # Parse once and collect every field in a single pass; a blank page
+    # just yields the default fields
+    root = _parse_html(html_content)
+    fields = _extract_all(root) if root is not None else {}
 
-    if title := extract_title(html_content):
+    if title := fields.get('title'):
         ret['title'] = title
 
-    if details := extract_details(html_content):
+    if details := fields.get('details'):
         ret['details'] = details
 
     studio = {}
-    if studio_name := extract_studio_name(html_content):
+    if studio_name := fields.get('studio_name'):
         studio['name'] = studio_name
     studio['url'] = "https://www.meanbitches.com/"
     if studio:
         ret['studio'] = studio
 
-    if performers := extract_performers(html_content):
+    if performers := fields.get('performers'):
         ret['performers'] = performers
 
-    if image := extract_image(html_content):
+    if image := fields.get('image') or extract_image(html_content, title=ret.get('title')):
         ret['image'] = image
 
-    if date := extract_date(html_content):
+    if date := fields.get('date'):
         ret['date'] = date
 
-    if tags := extract_tags(html_content):
+    if tags := fields.get('tags'):
         ret['tags'] = tags
 
     if code := extract_studio_code(html_content):